@@ -1,6 +1,9 @@
 """Configuration loading utilities."""
 
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 
 from nanobot.config.schema import Config
@@ -9,6 +12,9 @@ from nanobot.config.schema import Config
 # Global variable to store current config path (for multi-instance support)
 _current_config_path: Path | None = None
 
+# Last parsed config per file, keyed by the stat signature of the file it came from
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int, int], Config]] = {}
+
 
 def set_config_path(path: Path) -> None:
     """Set the current config path (used to derive data directory)."""
@@ -27,6 +33,16 @@ def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from file or create default.
 
+    The parsed config is cached per path and reused while the file's
+    (st_ino, st_ctime_ns, st_mtime_ns, st_size) is unchanged, so:
+
+    - atomic replaces (rename over the file) always produce a new inode and are
+      picked up, but an in-place, same-size rewrite within the filesystem's
+      timestamp granularity (a few ms on Linux, up to a second elsewhere) may
+      return the old config;
+    - NANOBOT_* environment overrides are applied when the file is parsed and
+      are not re-read on cache hits.
+
     Args:
         config_path: Optional path to config file. Uses default if not provided.
 
@@ -35,15 +51,32 @@ def load_config(config_path: Path | None = None) -> Config:
     """
     path = config_path or get_config_path()
 
-    if path.exists():
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-            data = _migrate_config(data)
-            return Config.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Warning: Failed to load config from {path}: {e}")
-            print("Using default configuration.")
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return Config()
+
+    signature = (st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[0] == signature:
+        # Callers mutate the returned config, so never hand out the cached instance.
+        return cached[1].model_copy(deep=True)
+
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        # Removed between stat() and open()
+        return Config()
+
+    try:
+        data = json.loads(raw)
+        data = _migrate_config(data)
+        config = Config.model_validate(data)
+        _CONFIG_CACHE[path] = (signature, config)
+        return config.model_copy(deep=True)
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"Warning: Failed to load config from {path}: {e}")
+        print("Using default configuration.")
 
     return Config()
 
@@ -57,12 +90,48 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
         config_path: Optional path to save to. Uses default if not provided.
     """
     path = config_path or get_config_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    data = config.model_dump(by_alias=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    payload = config.model_dump_json(by_alias=True, indent=2).encode("utf-8")
+
+    # Write to a unique temp file next to the real target (through any symlink),
+    # fsync it and rename it over the target, so a process crash or power loss
+    # mid-write never leaves a truncated config behind and concurrent saves
+    # don't share a temp file.
+    target = path.resolve()
+    try:
+        fd, tmp_name = _mkstemp_beside(target)
+    except FileNotFoundError:
+        # Only the first save into a fresh location needs the directory created
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = _mkstemp_beside(target)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            # Keep permissions of an existing config (it holds API keys)
+            mode = stat.S_IMODE(target.stat().st_mode)
+        except FileNotFoundError:
+            mode = _default_file_mode()
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _CONFIG_CACHE.pop(path, None)
+
+
+def _mkstemp_beside(target: Path) -> tuple[int, str]:
+    """Create a unique temp file in the target's directory."""
+    return tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+
+
+def _default_file_mode() -> int:
+    """Return the mode open(path, "w") would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
 
 def _migrate_config(data: dict) -> dict:
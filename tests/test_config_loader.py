@@ -0,0 +1,236 @@
+import json
+import os
+
+import pytest
+
+from nanobot.config import loader
+from nanobot.config.loader import load_config, save_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    loader._CONFIG_CACHE.clear()
+    yield
+    loader._CONFIG_CACHE.clear()
+
+
+def _write(path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_load_config_reuses_parse_while_file_is_unchanged(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 1111}}})
+
+    first = load_config(config_path)
+
+    calls = []
+    monkeypatch.setattr(
+        "nanobot.config.loader._migrate_config", lambda data: calls.append(data) or data
+    )
+    second = load_config(config_path)
+
+    assert calls == []
+    assert second.agents.defaults.max_tokens == 1111
+    assert second is not first
+
+
+def test_load_config_cache_hands_out_independent_copies(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"workspace": "~/a"}}})
+
+    load_config(config_path).agents.defaults.workspace = "~/mutated"
+
+    assert load_config(config_path).agents.defaults.workspace == "~/a"
+
+
+def test_load_config_reparses_after_file_changes(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 1}}})
+    assert load_config(config_path).agents.defaults.max_tokens == 1
+
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 22}}})
+
+    assert load_config(config_path).agents.defaults.max_tokens == 22
+
+
+def test_load_config_reparses_same_size_rewrite_with_new_mtime(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 11}}})
+    assert load_config(config_path).agents.defaults.max_tokens == 11
+    old = config_path.stat()
+
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 22}}})
+    os.utime(config_path, ns=(old.st_atime_ns, old.st_mtime_ns + 1_000_000_000))
+
+    assert config_path.stat().st_size == old.st_size
+    assert load_config(config_path).agents.defaults.max_tokens == 22
+
+
+def test_load_config_reparses_atomic_replace_with_same_size_and_mtime(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 11}}})
+    assert load_config(config_path).agents.defaults.max_tokens == 11
+    old = config_path.stat()
+
+    replacement = tmp_path / "config.json.new"
+    _write(replacement, {"agents": {"defaults": {"maxTokens": 22}}})
+    os.utime(replacement, ns=(old.st_atime_ns, old.st_mtime_ns))
+    os.replace(replacement, config_path)
+
+    new = config_path.stat()
+    assert (new.st_size, new.st_mtime_ns) == (old.st_size, old.st_mtime_ns)
+    assert load_config(config_path).agents.defaults.max_tokens == 22
+
+
+def test_save_config_invalidates_cached_load(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 1}}})
+
+    config = load_config(config_path)
+    config.agents.defaults.max_tokens = 2
+    save_config(config, config_path)
+
+    assert load_config(config_path).agents.defaults.max_tokens == 2
+
+
+def test_load_config_returns_defaults_for_missing_file(tmp_path) -> None:
+    config = load_config(tmp_path / "missing" / "config.json")
+
+    assert config.agents.defaults.max_tokens == 8192
+
+
+def test_save_config_creates_missing_parent_dirs(tmp_path) -> None:
+    config_path = tmp_path / "nested" / "instance" / "config.json"
+
+    save_config(load_config(config_path), config_path)
+
+    assert json.loads(config_path.read_text(encoding="utf-8"))["agents"]["defaults"]["maxTokens"] == 8192
+
+
+def test_save_config_replaces_file_atomically_and_keeps_mode(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {})
+    config_path.chmod(0o600)
+
+    save_config(load_config(config_path), config_path)
+
+    assert (config_path.stat().st_mode & 0o777) == 0o600
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert "agents" in json.loads(config_path.read_text(encoding="utf-8"))
+
+
+def test_save_config_keeps_old_file_when_replace_fails(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 7}}})
+
+    def _fail(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("nanobot.config.loader.os.replace", _fail)
+    with pytest.raises(OSError):
+        save_config(load_config(config_path), config_path)
+
+    assert json.loads(config_path.read_text(encoding="utf-8")) == {"agents": {"defaults": {"maxTokens": 7}}}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_save_config_removes_partial_temp_file_when_write_fails(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {"agents": {"defaults": {"maxTokens": 7}}})
+    real_fdopen = os.fdopen
+
+    class _DiskFull:
+        def __init__(self, f):
+            self._f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._f.close()
+
+        def write(self, data):
+            self._f.write(data[:10])
+            raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(
+        "nanobot.config.loader.os.fdopen", lambda fd, mode: _DiskFull(real_fdopen(fd, mode))
+    )
+    with pytest.raises(OSError):
+        save_config(load_config(config_path), config_path)
+
+    assert json.loads(config_path.read_text(encoding="utf-8")) == {"agents": {"defaults": {"maxTokens": 7}}}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_save_config_writes_through_symlink(tmp_path) -> None:
+    real = tmp_path / "real" / "config.json"
+    real.parent.mkdir()
+    _write(real, {"agents": {"defaults": {"maxTokens": 7}}})
+    link = tmp_path / "config.json"
+    link.symlink_to(real)
+
+    config = load_config(link)
+    config.agents.defaults.max_tokens = 8
+    save_config(config, link)
+
+    assert link.is_symlink()
+    assert json.loads(real.read_text(encoding="utf-8"))["agents"]["defaults"]["maxTokens"] == 8
+    assert list(tmp_path.glob("*.tmp")) == [] and list(real.parent.glob("*.tmp")) == []
+
+
+def test_save_config_new_file_gets_umask_default_mode(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    umask = os.umask(0o022)
+    try:
+        save_config(load_config(config_path), config_path)
+    finally:
+        os.umask(umask)
+
+    assert (config_path.stat().st_mode & 0o777) == 0o644
+
+
+def test_load_config_keeps_configs_that_stdlib_json_accepts(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"agents": {"defaults": {"temperature": NaN}},'
+        ' "providers": {"openai": {"apiKey": "sk-keep"}},'
+        ' "channels": {"x": {"id": 123456789012345678901234, "limit": Infinity}}}',
+        encoding="utf-8",
+    )
+
+    config = load_config(config_path)
+
+    assert config.providers.openai.api_key == "sk-keep"
+    assert config.agents.defaults.temperature != config.agents.defaults.temperature
+    assert config.channels.x == {"id": 123456789012345678901234, "limit": float("inf")}
+
+
+def test_load_config_ignores_unprefixed_env_vars(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, {})
+    monkeypatch.setenv("PROVIDERS", '{"openai": {"apiKey": "x"}}')
+    monkeypatch.setenv("GATEWAY", "1.2.3.4")
+
+    config = load_config(config_path)
+
+    assert config.providers.openai.api_key == ""
+    assert config.gateway.host == "0.0.0.0"
+
+
+def test_save_config_fsyncs_temp_file_before_replace(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(
+        "nanobot.config.loader.os.fsync", lambda fd: calls.append("fsync") or real_fsync(fd)
+    )
+    monkeypatch.setattr(
+        "nanobot.config.loader.os.replace",
+        lambda src, dst: calls.append("replace") or real_replace(src, dst),
+    )
+
+    save_config(load_config(config_path), config_path)
+
+    assert calls == ["fsync", "replace"]